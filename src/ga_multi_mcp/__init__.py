@@ -8,6 +8,15 @@ designed for use with LLM agents and the Programmatic Tool Calling (PTC) framewo
 __version__ = "0.1.0"
 __author__ = "Hey Good Game"
 
-from .server import main, mcp
-
 __all__ = ["main", "mcp", "__version__"]
+
+
+def __getattr__(name):
+    # Import the server lazily so reading __version__ doesn't pull in
+    # FastMCP and the Google API clients
+    if name in ("main", "mcp"):
+        from .server import main, mcp
+
+        globals().update(main=main, mcp=mcp)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,11 +5,16 @@ Handles environment-based configuration with sensible defaults
 and validation for required settings.
 """
 
-import json
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Set
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is an optional speedup (the "fast" extra)
+    import json as _json
 
 
 class ConfigError(Exception):
@@ -17,7 +22,32 @@ class ConfigError(Exception):
     pass
 
 
-@dataclass
+# Credentials paths already confirmed to exist (skips repeat stat calls)
+_existing_credentials_paths: Set[str] = set()
+
+
+def _credentials_file_exists(credentials_path: str) -> bool:
+    """
+    Check whether the credentials file exists.
+
+    Only positive results are remembered, so a file that appears later
+    is still picked up on the next load.
+    """
+    if credentials_path in _existing_credentials_paths:
+        return True
+    if Path(credentials_path).exists():
+        _existing_credentials_paths.add(credentials_path)
+        return True
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def _load_credentials(credentials_path: str) -> Dict[str, Any]:
+    """Read and parse a service account JSON file, once per path."""
+    return _json.loads(Path(credentials_path).read_bytes())
+
+
+@dataclass(slots=True, frozen=True)
 class Config:
     """
     Configuration for the GA Multi MCP server.
@@ -35,6 +65,12 @@ class Config:
     # Cache TTL for property list (seconds)
     property_cache_ttl: int = 3600  # 1 hour
 
+    # Cache TTL for property metadata (seconds)
+    metadata_cache_ttl: int = 3600  # 1 hour
+
+    # Maximum number of cached API responses (least recently used evicted)
+    cache_max_entries: int = 1024
+
     # Fuzzy matching threshold (0.0 to 1.0)
     fuzzy_threshold: float = 0.6
 
@@ -47,6 +83,11 @@ class Config:
     # Whether to mask error details in responses
     mask_error_details: bool = False
 
+    @property
+    def credentials_dict(self) -> Dict[str, Any]:
+        """Parsed service account JSON, read from disk once per path."""
+        return _load_credentials(self.credentials_path)
+
     @classmethod
     def from_env(cls) -> "Config":
         """
@@ -57,6 +98,9 @@ class Config:
             GA_CREDENTIALS_PATH: Alternative path to service account JSON
             GA_CACHE_TTL: Cache TTL for API responses in seconds (default: 300)
             GA_PROPERTY_CACHE_TTL: Cache TTL for property list in seconds (default: 3600)
+            GA_METADATA_CACHE_TTL: Cache TTL for property metadata in seconds
+                (default: same as GA_PROPERTY_CACHE_TTL)
+            GA_CACHE_MAX_ENTRIES: Maximum number of cached API responses (default: 1024)
             GA_FUZZY_THRESHOLD: Fuzzy matching threshold 0.0-1.0 (default: 0.6)
             GA_PROPERTY_ALIASES: JSON string of custom aliases
             GA_DEFAULT_LIMIT: Default limit for query results (default: 1000)
@@ -83,8 +127,7 @@ class Config:
             )
 
         # Validate credentials file exists
-        credentials_file = Path(credentials_path)
-        if not credentials_file.exists():
+        if not _credentials_file_exists(credentials_path):
             raise ConfigError(
                 f"Credentials file not found at: {credentials_path}. "
                 "Please ensure the file exists and the path is correct."
@@ -108,6 +151,29 @@ class Config:
                     f"GA_PROPERTY_CACHE_TTL must be an integer, got: {property_cache_ttl_str}"
                 )
 
+        # Parse optional metadata cache TTL
+        metadata_cache_ttl = property_cache_ttl
+        if metadata_cache_ttl_str := os.getenv("GA_METADATA_CACHE_TTL"):
+            try:
+                metadata_cache_ttl = int(metadata_cache_ttl_str)
+            except ValueError:
+                raise ConfigError(
+                    f"GA_METADATA_CACHE_TTL must be an integer, got: {metadata_cache_ttl_str}"
+                )
+
+        # Parse optional cache size
+        cache_max_entries = 1024
+        if cache_max_entries_str := os.getenv("GA_CACHE_MAX_ENTRIES"):
+            try:
+                cache_max_entries = int(cache_max_entries_str)
+                if cache_max_entries < 1:
+                    raise ValueError("Must be positive")
+            except ValueError as e:
+                raise ConfigError(
+                    f"GA_CACHE_MAX_ENTRIES must be a positive integer, "
+                    f"got: {cache_max_entries_str}. {e}"
+                )
+
         # Parse optional fuzzy threshold
         fuzzy_threshold = 0.6
         if fuzzy_threshold_str := os.getenv("GA_FUZZY_THRESHOLD"):
@@ -125,10 +191,10 @@ class Config:
         custom_aliases = {}
         if aliases_json := os.getenv("GA_PROPERTY_ALIASES"):
             try:
-                custom_aliases = json.loads(aliases_json)
+                custom_aliases = _json.loads(aliases_json)
                 if not isinstance(custom_aliases, dict):
                     raise ValueError("Must be a JSON object")
-            except (json.JSONDecodeError, ValueError) as e:
+            except ValueError as e:
                 raise ConfigError(
                     f"GA_PROPERTY_ALIASES must be valid JSON object, got: {aliases_json}. {e}"
                 )
@@ -152,6 +218,8 @@ class Config:
             credentials_path=credentials_path,
             cache_ttl=cache_ttl,
             property_cache_ttl=property_cache_ttl,
+            metadata_cache_ttl=metadata_cache_ttl,
+            cache_max_entries=cache_max_entries,
             fuzzy_threshold=fuzzy_threshold,
             custom_aliases=custom_aliases,
             default_limit=default_limit,
@@ -159,15 +227,13 @@ class Config:
         )
 
 
-# Global config instance (lazy loaded)
-_config: Optional[Config] = None
-
-
+@functools.cache
 def get_config() -> Config:
     """
     Get the global configuration instance.
 
-    Configuration is loaded from environment variables on first access.
+    Configuration is loaded from environment variables on first access
+    and memoized; failed loads are not cached.
 
     Returns:
         Config: The configuration instance
@@ -175,13 +241,11 @@ def get_config() -> Config:
     Raises:
         ConfigError: If configuration is invalid
     """
-    global _config
-    if _config is None:
-        _config = Config.from_env()
-    return _config
+    return Config.from_env()
 
 
 def reset_config() -> None:
     """Reset the global configuration (useful for testing)."""
-    global _config
-    _config = None
+    get_config.cache_clear()
+    _existing_credentials_paths.clear()
+    _load_credentials.cache_clear()
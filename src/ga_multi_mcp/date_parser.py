@@ -5,9 +5,9 @@ Supports various date formats and relative date expressions
 commonly used when querying analytics data.
 """
 
-import re
-from datetime import datetime, timedelta
-from typing import Tuple
+import functools
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Optional, Tuple
 
 
 class DateParseError(Exception):
@@ -15,7 +15,152 @@ class DateParseError(Exception):
     pass
 
 
-def parse_date(date_str: str) -> str:
+def _today(today: datetime) -> str:
+    return today.date().isoformat()
+
+
+def _yesterday(today: datetime) -> str:
+    return (today - timedelta(days=1)).date().isoformat()
+
+
+def _last_week(today: datetime) -> str:
+    """Start of previous week (Monday)."""
+    # Go to start of current week, then back 7 days
+    start_of_week = today - timedelta(days=today.weekday())
+    return (start_of_week - timedelta(days=7)).date().isoformat()
+
+
+def _last_month(today: datetime) -> str:
+    """First day of previous month."""
+    last_month = today.replace(day=1) - timedelta(days=1)
+    return last_month.replace(day=1).date().isoformat()
+
+
+def _this_week(today: datetime) -> str:
+    """Start of current week (Monday)."""
+    return (today - timedelta(days=today.weekday())).date().isoformat()
+
+
+def _this_month(today: datetime) -> str:
+    """First day of current month."""
+    return today.replace(day=1).date().isoformat()
+
+
+def _this_year(today: datetime) -> str:
+    """First day of current year."""
+    return today.replace(month=1, day=1).date().isoformat()
+
+
+def _last_year(today: datetime) -> str:
+    """First day of previous year."""
+    return today.replace(year=today.year - 1, month=1, day=1).date().isoformat()
+
+
+# Day counts used by GA's standard reporting ranges
+_COMMON_DAYS_AGO = frozenset((7, 14, 28, 30, 90))
+
+# Formatted "N days ago" dates for the standard ranges, keyed by
+# (today's ordinal, N); only the current day's entries are kept
+_DAYS_AGO_CACHE: Dict[Tuple[int, int], str] = {}
+
+
+def _days_ago(today: datetime, days: int) -> str:
+    key = (today.toordinal(), days)
+    if cached := _DAYS_AGO_CACHE.get(key):
+        return cached
+
+    result = (today - timedelta(days=days)).date().isoformat()
+    if days in _COMMON_DAYS_AGO:
+        # A full table without this key means the day has rolled over
+        if len(_DAYS_AGO_CACHE) >= len(_COMMON_DAYS_AGO):
+            _DAYS_AGO_CACHE.clear()
+        _DAYS_AGO_CACHE[key] = result
+    return result
+
+
+def _weeks_ago(today: datetime, weeks: int) -> str:
+    return (today - timedelta(weeks=weeks)).date().isoformat()
+
+
+def _months_ago(today: datetime, months: int) -> str:
+    """Approximate - 30 days per month."""
+    return (today - timedelta(days=months * 30)).date().isoformat()
+
+
+# "N <unit>s ago" handlers keyed by unit
+_AGO_HANDLERS: Dict[str, Callable[[datetime, int], str]] = {
+    "day": _days_ago,
+    "week": _weeks_ago,
+    "month": _months_ago,
+}
+
+
+# Labels for ranges of N days ending today
+_LAST_N_LABELS: Dict[int, str] = {n: f"Last {n} days" for n in (7, 14, 28, 30, 90)}
+
+# Keyword dates resolved with a single dict lookup
+_LITERAL_HANDLERS: Dict[str, Callable[[datetime], str]] = {
+    "today": _today,
+    "yesterday": _yesterday,
+    "last week": _last_week,
+    "lastweek": _last_week,
+    "last month": _last_month,
+    "lastmonth": _last_month,
+    "this week": _this_week,
+    "thisweek": _this_week,
+    "this month": _this_month,
+    "thismonth": _this_month,
+    "this year": _this_year,
+    "thisyear": _this_year,
+    "ytd": _this_year,
+    "last year": _last_year,
+    "lastyear": _last_year,
+}
+
+
+def _is_iso(date_str: str) -> bool:
+    """Check for the YYYY-MM-DD shape without a regex."""
+    return (
+        len(date_str) == 10
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+        and date_str[:4].isdecimal()
+        and date_str[5:7].isdecimal()
+        and date_str[8:].isdecimal()
+    )
+
+
+def _split_us(date_str: str) -> Optional[Tuple[int, int, int]]:
+    """Split MM/DD/YYYY (1-2 digit month/day) into (month, day, year)."""
+    parts = date_str.split("/")
+    if len(parts) != 3:
+        return None
+    month, day, year = parts
+    if not (
+        1 <= len(month) <= 2
+        and 1 <= len(day) <= 2
+        and len(year) == 4
+        and (month + day + year).isdecimal()
+    ):
+        return None
+    return int(month), int(day), int(year)
+
+
+def _split_ago(date_str: str) -> Optional[Tuple[int, str]]:
+    """Split "N <unit>[s] ago" (spaces optional) into (N, unit)."""
+    if not date_str.endswith("ago"):
+        return None
+    rest = date_str[:-3].rstrip()
+    if rest.endswith("s"):
+        rest = rest[:-1]
+    for unit in _AGO_HANDLERS:
+        if rest.endswith(unit):
+            count = rest[:-len(unit)].rstrip()
+            return (int(count), unit) if count.isdecimal() else None
+    return None
+
+
+def parse_date(date_str: str, *, today: Optional[datetime] = None) -> str:
     """
     Parse a date string into YYYY-MM-DD format.
 
@@ -30,6 +175,7 @@ def parse_date(date_str: str) -> str:
 
     Args:
         date_str: The date string to parse
+        today: Reference date for relative expressions (defaults to now)
 
     Returns:
         str: Date in YYYY-MM-DD format
@@ -40,75 +186,47 @@ def parse_date(date_str: str) -> str:
     if not date_str:
         raise DateParseError("Date string cannot be empty")
 
-    date_str = date_str.strip().lower()
-    today = datetime.now()
+    # Already-normalized ISO dates (the common programmatic case) skip
+    # the strip/lower copies and the cache lookup
+    if _is_iso(date_str):
+        return date_str
+
+    today = today or datetime.now()
+    return _parse_date_cached(date_str.strip().lower(), today.toordinal())
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_date_cached(date_str: str, today_ordinal: int) -> str:
+    """
+    Parse a normalized date string relative to the given day.
+
+    Keyed on the ordinal of "today" so cached relative dates roll over
+    at midnight.
+    """
+    today = datetime.fromordinal(today_ordinal)
+
+    # Keyword dates (today, last week, ytd, ...)
+    if handler := _LITERAL_HANDLERS.get(date_str):
+        return handler(today)
 
     # ISO format (YYYY-MM-DD)
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", date_str):
+    if _is_iso(date_str):
         return date_str
 
     # US format (MM/DD/YYYY)
-    if match := re.match(r"^(\d{1,2})/(\d{1,2})/(\d{4})$", date_str):
-        month, day, year = match.groups()
+    if us_parts := _split_us(date_str):
+        month, day, year = us_parts
         try:
-            parsed = datetime(int(year), int(month), int(day))
-            return parsed.strftime("%Y-%m-%d")
+            # Validates the calendar date; the string is built directly
+            date(year, month, day)
+            return f"{year:04d}-{month:02d}-{day:02d}"
         except ValueError as e:
             raise DateParseError(f"Invalid date: {date_str}. {e}")
 
-    # Relative dates
-    if date_str == "today":
-        return today.strftime("%Y-%m-%d")
-
-    if date_str == "yesterday":
-        return (today - timedelta(days=1)).strftime("%Y-%m-%d")
-
-    # N days ago
-    if match := re.match(r"^(\d+)\s*days?\s*ago$", date_str):
-        days = int(match.group(1))
-        return (today - timedelta(days=days)).strftime("%Y-%m-%d")
-
-    # N weeks ago
-    if match := re.match(r"^(\d+)\s*weeks?\s*ago$", date_str):
-        weeks = int(match.group(1))
-        return (today - timedelta(weeks=weeks)).strftime("%Y-%m-%d")
-
-    # N months ago (approximate - 30 days per month)
-    if match := re.match(r"^(\d+)\s*months?\s*ago$", date_str):
-        months = int(match.group(1))
-        return (today - timedelta(days=months * 30)).strftime("%Y-%m-%d")
-
-    # Last week (start of previous week - Monday)
-    if date_str in ("last week", "lastweek"):
-        # Go to start of current week, then back 7 days
-        days_since_monday = today.weekday()
-        start_of_week = today - timedelta(days=days_since_monday)
-        last_week_start = start_of_week - timedelta(days=7)
-        return last_week_start.strftime("%Y-%m-%d")
-
-    # Last month (first day of previous month)
-    if date_str in ("last month", "lastmonth"):
-        first_of_current_month = today.replace(day=1)
-        last_month = first_of_current_month - timedelta(days=1)
-        return last_month.replace(day=1).strftime("%Y-%m-%d")
-
-    # This week (start of current week - Monday)
-    if date_str in ("this week", "thisweek"):
-        days_since_monday = today.weekday()
-        start_of_week = today - timedelta(days=days_since_monday)
-        return start_of_week.strftime("%Y-%m-%d")
-
-    # This month (first day of current month)
-    if date_str in ("this month", "thismonth"):
-        return today.replace(day=1).strftime("%Y-%m-%d")
-
-    # Start of year
-    if date_str in ("this year", "thisyear", "ytd"):
-        return today.replace(month=1, day=1).strftime("%Y-%m-%d")
-
-    # Last year
-    if date_str in ("last year", "lastyear"):
-        return today.replace(year=today.year - 1, month=1, day=1).strftime("%Y-%m-%d")
+    # N days/weeks/months ago
+    if ago := _split_ago(date_str):
+        count, unit = ago
+        return _AGO_HANDLERS[unit](today, count)
 
     raise DateParseError(
         f"Could not parse date: '{date_str}'. "
@@ -120,7 +238,9 @@ def parse_date(date_str: str) -> str:
 
 def parse_date_range(
     start_date: str,
-    end_date: str
+    end_date: str,
+    *,
+    today: Optional[datetime] = None
 ) -> Tuple[str, str]:
     """
     Parse a date range with validation.
@@ -128,6 +248,7 @@ def parse_date_range(
     Args:
         start_date: Start date string
         end_date: End date string
+        today: Reference date for relative expressions (defaults to now)
 
     Returns:
         Tuple[str, str]: (start_date, end_date) in YYYY-MM-DD format
@@ -135,14 +256,23 @@ def parse_date_range(
     Raises:
         DateParseError: If dates cannot be parsed or range is invalid
     """
-    start = parse_date(start_date)
-    end = parse_date(end_date)
+    today = today or datetime.now()
+    return _parse_date_range_cached(start_date, end_date, today.toordinal())
 
-    # Validate range
-    start_dt = datetime.strptime(start, "%Y-%m-%d")
-    end_dt = datetime.strptime(end, "%Y-%m-%d")
 
-    if start_dt > end_dt:
+@functools.lru_cache(maxsize=512)
+def _parse_date_range_cached(
+    start_date: str,
+    end_date: str,
+    today_ordinal: int
+) -> Tuple[str, str]:
+    """Parse and validate a date range relative to the given day."""
+    today = datetime.fromordinal(today_ordinal)
+    start = parse_date(start_date, today=today)
+    end = parse_date(end_date, today=today)
+
+    # Validate range
+    if date.fromisoformat(start) > date.fromisoformat(end):
         raise DateParseError(
             f"Start date ({start}) must be before or equal to end date ({end})"
         )
@@ -150,42 +280,51 @@ def parse_date_range(
     return start, end
 
 
-def get_date_range_description(start_date: str, end_date: str) -> str:
+def get_date_range_description(
+    start_date: str,
+    end_date: str,
+    *,
+    today: Optional[datetime] = None
+) -> str:
     """
     Generate a human-readable description of a date range.
 
     Args:
         start_date: Start date in YYYY-MM-DD format
         end_date: End date in YYYY-MM-DD format
+        today: Reference date for "Today"/"Last N days" labels (defaults to now)
 
     Returns:
         str: Human-readable description
     """
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-    end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    today = today or datetime.now()
+    return _get_date_range_description_cached(start_date, end_date, today.toordinal())
+
+
+@functools.lru_cache(maxsize=512)
+def _get_date_range_description_cached(
+    start_date: str,
+    end_date: str,
+    today_ordinal: int
+) -> str:
+    """Describe a date range relative to the given day."""
+    start_dt = date.fromisoformat(start_date)
+    end_dt = date.fromisoformat(end_date)
+    today = date.fromordinal(today_ordinal)
 
     days = (end_dt - start_dt).days + 1
 
     # Check for common ranges
     if start_dt == end_dt:
-        if end_dt.date() == today.date():
+        if end_dt == today:
             return "Today"
-        elif end_dt.date() == (today - timedelta(days=1)).date():
+        elif end_dt == today - timedelta(days=1):
             return "Yesterday"
         else:
             return start_dt.strftime("%B %d, %Y")
 
-    if end_dt.date() == today.date():
-        if days == 7:
-            return "Last 7 days"
-        elif days == 14:
-            return "Last 14 days"
-        elif days == 28:
-            return "Last 28 days"
-        elif days == 30:
-            return "Last 30 days"
-        elif days == 90:
-            return "Last 90 days"
+    if end_dt == today:
+        if label := _LAST_N_LABELS.get(days):
+            return label
 
     return f"{start_dt.strftime('%b %d')} - {end_dt.strftime('%b %d, %Y')} ({days} days)"
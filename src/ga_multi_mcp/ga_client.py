@@ -5,51 +5,222 @@ Provides a clean interface for querying GA4 data with automatic
 property discovery and caching to minimize API calls.
 """
 
+import asyncio
+import fnmatch
+import functools
+import hashlib
+import json
 import logging
+import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
-from google.analytics.data_v1beta.types import (
-    DateRange,
-    Dimension,
-    Filter,
-    FilterExpression,
-    FilterExpressionList,
-    Metric,
-    NumericValue,
-    OrderBy,
-    RunRealtimeReportRequest,
-    RunReportRequest,
+from datetime import date
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
 )
+
 from google.api_core.exceptions import GoogleAPIError
 from google.oauth2.service_account import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 
 from .config import get_config
 
+if TYPE_CHECKING:
+    # The Data API client and its proto types are slow to import, so they
+    # are loaded on first use; property discovery never needs them.
+    from google.analytics.data_v1beta import BetaAnalyticsDataClient
+    from google.analytics.data_v1beta.types import Filter, FilterExpression, OrderBy
+
 logger = logging.getLogger(__name__)
 
+# Max concurrent Admin API requests (stays under GA's per-second quota)
+_ADMIN_API_CONCURRENCY = 10
+
+# Max sub-requests per Admin API batch HTTP request
+_ADMIN_BATCH_SIZE = 50
+
+# Numeric shapes of Data API metric values (checked without try/except)
+_INT_VALUE = re.compile(r"[-+]?\d+").fullmatch
+_FLOAT_VALUE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?").fullmatch
+
+# Cache TTL cap (seconds) for reports whose range includes today, which
+# GA is still filling in
+_LIVE_REPORT_CACHE_TTL = 30
+
+# Reports with more rows than this are not cached, so the entry-count cap
+# also bounds the cache's memory (the tools default to 1000-row reports)
+_MAX_CACHED_REPORT_ROWS = 1000
+
+# Minimum interval (seconds) between sweeps of expired cache entries
+_CACHE_SWEEP_INTERVAL = 60
+
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}").fullmatch
+
+
+def _report_cache_key(property_id: str, *args: Any) -> str:
+    """
+    Cache key for a report: the property ID plus a hash of the query.
+
+    The property ID stays readable so invalidate() and clear_cache()
+    patterns can target one property's reports.
+    """
+    query = json.dumps(args, sort_keys=True, default=str).encode()
+    return f"report:{property_id}:{hashlib.blake2b(query, digest_size=16).hexdigest()}"
+
+
+def _includes_today(end_date: str) -> bool:
+    """Whether a report range may include today (relative dates count)."""
+    return not _ISO_DATE(end_date) or end_date >= date.today().isoformat()
+
+
+# Deletes every ASCII character that is not a letter or digit
+_ASCII_NON_ALNUM = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if not chr(i).isalnum())
+)
+
+
+def normalize_name(value: str) -> str:
+    """
+    Lowercase a name and drop everything except letters and digits.
+
+    ASCII names (the common case) go through a str.translate table;
+    other names fall back to a per-character isalnum() check so that
+    accented letters are kept and Unicode punctuation is removed.
+    """
+    value = value.lower()
+    if value.isascii():
+        return value.translate(_ASCII_NON_ALNUM)
+    return "".join(c for c in value if c.isalnum())
+
+
+# Filter operator names accepted by run_report
+_STRING_OPS = frozenset(("EXACT", "CONTAINS", "BEGINS_WITH", "ENDS_WITH", "REGEXP"))
+_NUMERIC_OPS = frozenset(("GREATER_THAN", "LESS_THAN", "EQUAL"))
+
+
+@functools.cache
+def _filter_op_maps() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Map filter operator names to Data API enums (built on first use)."""
+    from google.analytics.data_v1beta.types import Filter
+
+    match_type_map = {
+        "EXACT": Filter.StringFilter.MatchType.EXACT,
+        "CONTAINS": Filter.StringFilter.MatchType.CONTAINS,
+        "BEGINS_WITH": Filter.StringFilter.MatchType.BEGINS_WITH,
+        "ENDS_WITH": Filter.StringFilter.MatchType.ENDS_WITH,
+        "REGEXP": Filter.StringFilter.MatchType.FULL_REGEXP,
+    }
+    op_map = {
+        "GREATER_THAN": Filter.NumericFilter.Operation.GREATER_THAN,
+        "LESS_THAN": Filter.NumericFilter.Operation.LESS_THAN,
+        "EQUAL": Filter.NumericFilter.Operation.EQUAL,
+    }
+    return match_type_map, op_map
+
+
+def _parse_metric_value(value: str) -> Any:
+    """Convert a metric value to int or float, leaving other strings as-is."""
+    if _INT_VALUE(value):
+        return int(value)
+    if _FLOAT_VALUE(value):
+        return float(value)
+    return value
+
+
+def _parse_metric_column(values: Tuple[str, ...], metric_type: Any) -> List[Any]:
+    """Convert one metric column, using the header's declared type."""
+    from google.analytics.data_v1beta.types import MetricType
+
+    if metric_type == MetricType.TYPE_INTEGER:
+        try:
+            return list(map(int, values))
+        except ValueError:
+            pass
+    return list(map(_parse_metric_value, values))
+
+
+def _format_rows(response: Any) -> Tuple[List[str], List[str], List[Dict[str, Any]]]:
+    """
+    Flatten a report response into header names and row dicts.
+
+    Reads the underlying protobuf message directly rather than through
+    the proto-plus wrappers, which marshal a new wrapper object for every
+    row and cell. Metric values are transposed into columns and converted
+    a column at a time based on each metric header's type.
+
+    Returns:
+        Tuple of (dimension_headers, metric_headers, rows)
+    """
+    pb = type(response).pb(response)
+    dimension_headers = [h.name for h in pb.dimension_headers]
+    metric_headers = [h.name for h in pb.metric_headers]
+    headers = dimension_headers + metric_headers
+
+    dimension_rows = []
+    metric_value_rows = []
+    for row in pb.rows:
+        dimension_rows.append([v.value for v in row.dimension_values])
+        metric_value_rows.append([v.value for v in row.metric_values])
+
+    metric_columns = [
+        _parse_metric_column(column, header.type_)
+        for column, header in zip(zip(*metric_value_rows), pb.metric_headers)
+    ]
+    metric_rows = zip(*metric_columns) if metric_columns else [()] * len(dimension_rows)
+
+    rows = [
+        dict(zip(headers, [*dimension_values, *metric_values]))
+        for dimension_values, metric_values in zip(dimension_rows, metric_rows)
+    ]
+    return dimension_headers, metric_headers, rows
+
 
 @dataclass
 class CacheEntry:
-    """A cached value with expiration time."""
+    """A cached value with expiration time (on the time.monotonic() clock)."""
     data: Any
     expires_at: float
 
-    def is_valid(self) -> bool:
-        return datetime.now().timestamp() < self.expires_at
+    def is_valid(self, now: Optional[float] = None) -> bool:
+        return (time.monotonic() if now is None else now) < self.expires_at
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GAProperty:
-    """Represents a GA4 property."""
+    """
+    Represents a GA4 property.
+
+    The matching keys are derived from display_name on construction. An
+    empty name defaults to the first 30 characters of display_clean.
+    """
     id: str
     name: str
     display_name: str
     account_id: str
     website_url: Optional[str] = None
+    # Lowercased alphanumeric display name, used for matching
+    display_clean: str = field(init=False)
+    # Lowercased display name, used for exact display-name lookups
+    display_lower: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        display_clean = normalize_name(self.display_name)
+        object.__setattr__(self, "display_clean", display_clean)
+        object.__setattr__(self, "display_lower", self.display_name.lower())
+        if not self.name:
+            object.__setattr__(self, "name", display_clean[:30])
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -96,10 +267,21 @@ class GAClient:
         self.credentials_path = credentials_path or config.credentials_path
         self.cache_ttl = config.cache_ttl
         self.property_cache_ttl = config.property_cache_ttl
+        self.metadata_cache_ttl = config.metadata_cache_ttl
+        self.cache_max_entries = config.cache_max_entries
 
-        self._data_client: Optional[BetaAnalyticsDataClient] = None
+        self._credentials: Optional[Credentials] = None
+        self._data_client: Optional["BetaAnalyticsDataClient"] = None
         self._admin_client = None
-        self._cache: Dict[str, CacheEntry] = {}
+        # Per-thread Admin API transports (see _admin_http)
+        self._admin_http_local = threading.local()
+        self._admin_http_lock = threading.Lock()
+        self._admin_https: List[AuthorizedHttp] = []
+        # Insertion/access ordered so the least recently used entry is first
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._last_sweep = time.monotonic()
+        # Cache key -> API request currently running to fill that key
+        self._in_flight: Dict[str, "asyncio.Task[Any]"] = {}
         self._initialized = False
 
     def _initialize(self) -> None:
@@ -107,16 +289,24 @@ class GAClient:
         if self._initialized:
             return
 
+        scopes = [
+            "https://www.googleapis.com/auth/analytics.readonly",
+            "https://www.googleapis.com/auth/analytics.manage.users.readonly",
+        ]
+
         try:
-            credentials = Credentials.from_service_account_file(
-                self.credentials_path,
-                scopes=[
-                    "https://www.googleapis.com/auth/analytics.readonly",
-                    "https://www.googleapis.com/auth/analytics.manage.users.readonly",
-                ],
-            )
+            config = get_config()
+            if self.credentials_path == config.credentials_path:
+                # Reuse the service account JSON already parsed by the config
+                credentials = Credentials.from_service_account_info(
+                    config.credentials_dict, scopes=scopes
+                )
+            else:
+                credentials = Credentials.from_service_account_file(
+                    self.credentials_path, scopes=scopes
+                )
 
-            self._data_client = BetaAnalyticsDataClient(credentials=credentials)
+            self._credentials = credentials
             self._admin_client = build(
                 "analyticsadmin",
                 "v1beta",
@@ -128,19 +318,113 @@ class GAClient:
         except Exception as e:
             raise GAClientError(f"Failed to initialize GA client: {e}")
 
+    def _get_data_client(self) -> "BetaAnalyticsDataClient":
+        """Get the Data API client, creating it on first use."""
+        self._initialize()
+        if self._data_client is None:
+            from google.analytics.data_v1beta import BetaAnalyticsDataClient
+
+            try:
+                self._data_client = BetaAnalyticsDataClient(
+                    credentials=self._credentials
+                )
+            except Exception as e:
+                raise GAClientError(f"Failed to initialize GA client: {e}")
+        return self._data_client
+
+    def _admin_http(self) -> AuthorizedHttp:
+        """
+        Get the calling thread's authorized HTTP transport for the Admin API.
+
+        httplib2 connections are not thread-safe, so each worker thread keeps
+        its own transport and reuses its open connections across requests.
+        build_http() keeps the client library's defaults (request timeout,
+        no 308 redirects) that a bare httplib2.Http() lacks.
+        """
+        http = getattr(self._admin_http_local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(self._credentials, http=build_http())
+            self._admin_http_local.http = http
+            with self._admin_http_lock:
+                self._admin_https.append(http)
+        return http
+
+    def _execute_admin(self, request: Any) -> Any:
+        """Execute an Admin API request or batch on this thread's transport."""
+        return request.execute(http=self._admin_http())
+
+    def close(self) -> None:
+        """Close the API transports and their pooled connections."""
+        with self._admin_http_lock:
+            admin_https, self._admin_https = self._admin_https, []
+        self._admin_http_local = threading.local()
+        for http in admin_https:
+            http.close()
+
+        if self._data_client is not None:
+            self._data_client.transport.close()
+            self._data_client = None
+
     def _get_cached(self, key: str) -> Optional[Any]:
         """Get a value from cache if valid."""
         if entry := self._cache.get(key):
             if entry.is_valid():
+                self._cache.move_to_end(key)
                 return entry.data
             del self._cache[key]
         return None
 
-    def _set_cached(self, key: str, data: Any, ttl: Optional[int] = None) -> None:
-        """Set a value in cache with TTL."""
-        ttl = ttl or self.cache_ttl
-        expires_at = datetime.now().timestamp() + ttl
-        self._cache[key] = CacheEntry(data=data, expires_at=expires_at)
+    def _cache_ttl_for(self, category: str) -> int:
+        """TTL in seconds for a cache category."""
+        if category == "properties":
+            return self.property_cache_ttl
+        if category == "metadata":
+            return self.metadata_cache_ttl
+        if category == "live_report":
+            return min(self.cache_ttl, _LIVE_REPORT_CACHE_TTL)
+        return self.cache_ttl
+
+    def _set_cached(self, key: str, data: Any, category: str = "report") -> None:
+        """
+        Set a value in cache, evicting old entries when full.
+
+        Args:
+            key: Cache key
+            data: Value to cache
+            category: "properties", "metadata", "report" or "live_report"
+                (a report covering today); selects the TTL
+        """
+        ttl = self._cache_ttl_for(category)
+        now = time.monotonic()
+        self._cache[key] = CacheEntry(data=data, expires_at=now + ttl)
+        self._cache.move_to_end(key)
+
+        if now - self._last_sweep >= _CACHE_SWEEP_INTERVAL:
+            # Drop expired entries every so often rather than on every
+            # insert, so they neither linger nor cost a full scan each time
+            self._last_sweep = now
+            for expired_key in [k for k, e in self._cache.items() if not e.is_valid(now)]:
+                del self._cache[expired_key]
+        while len(self._cache) > self.cache_max_entries:
+            self._cache.popitem(last=False)
+
+    async def _coalesce(
+        self, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Run fetch() for a cache key, sharing one request among concurrent callers.
+
+        The first caller for a key starts the request; anyone asking for the
+        same key before it finishes awaits that request instead of issuing
+        their own. The request is shielded so that one caller being
+        cancelled does not cancel it for the others.
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
 
     async def discover_properties(self) -> List[GAProperty]:
         """
@@ -156,46 +440,79 @@ class GAClient:
         if cached := self._get_cached(cache_key):
             return cached
 
+        return await self._coalesce(cache_key, self._fetch_properties)
+
+    async def _fetch_properties(self) -> List[GAProperty]:
+        """List properties from the Admin API and cache them (uncached)."""
+        cache_key = "properties"
         self._initialize()
 
         try:
             properties = []
 
             # List all accounts
-            accounts_response = self._admin_client.accounts().list().execute()
+            accounts_response = await asyncio.to_thread(
+                self._execute_admin, self._admin_client.accounts().list()
+            )
+            accounts = accounts_response.get("accounts", [])
+
+            # Fetch every account's properties in batch HTTP requests
+            semaphore = asyncio.Semaphore(_ADMIN_API_CONCURRENCY)
+
+            async def list_properties_batch(
+                account_names: List[str],
+            ) -> List[Dict[str, Any]]:
+                responses: Dict[str, Dict[str, Any]] = {}
+
+                def collect(request_id: str, response: Dict[str, Any], exception) -> None:
+                    if exception is not None:
+                        raise exception
+                    responses[request_id] = response
+
+                batch = self._admin_client.new_batch_http_request(callback=collect)
+                for i, account_name in enumerate(account_names):
+                    batch.add(
+                        self._admin_client.properties().list(
+                            filter=f"parent:{account_name}"
+                        ),
+                        request_id=str(i),
+                    )
 
-            for account in accounts_response.get("accounts", []):
-                account_name = account.get("name", "")
-                account_id = account_name.split("/")[-1] if account_name else ""
+                async with semaphore:
+                    await asyncio.to_thread(self._execute_admin, batch)
+
+                # Callbacks may fire out of order; restore account order
+                return [responses[str(i)] for i in range(len(account_names))]
 
-                # Get properties for this account
-                props_response = (
-                    self._admin_client.properties()
-                    .list(filter=f"parent:{account_name}")
-                    .execute()
+            account_names = [a.get("name", "") for a in accounts]
+            batch_responses = await asyncio.gather(
+                *(
+                    list_properties_batch(account_names[i:i + _ADMIN_BATCH_SIZE])
+                    for i in range(0, len(account_names), _ADMIN_BATCH_SIZE)
                 )
+            )
+            props_responses = [r for batch in batch_responses for r in batch]
+
+            for account, props_response in zip(accounts, props_responses):
+                account_name = account.get("name", "")
+                account_id = account_name.split("/")[-1] if account_name else ""
 
                 for prop in props_response.get("properties", []):
                     prop_name = prop.get("name", "")
                     prop_id = prop_name.split("/")[-1] if prop_name else ""
-                    display_name = prop.get("displayName", "")
-
-                    # Create clean name for matching
-                    clean_name = "".join(
-                        c for c in display_name.lower() if c.isalnum()
-                    )[:30]
 
+                    # The clean matching name is derived from display_name
                     properties.append(
                         GAProperty(
                             id=prop_id,
-                            name=clean_name,
-                            display_name=display_name,
+                            name="",
+                            display_name=prop.get("displayName", ""),
                             account_id=account_id,
                             website_url=prop.get("websiteUrl"),
                         )
                     )
 
-            self._set_cached(cache_key, properties, self.property_cache_ttl)
+            self._set_cached(cache_key, properties, category="properties")
             logger.info(f"Discovered {len(properties)} GA4 properties")
             return properties
 
@@ -219,11 +536,19 @@ class GAClient:
         if cached := self._get_cached(cache_key):
             return cached
 
-        self._initialize()
+        return await self._coalesce(
+            cache_key, lambda: self._fetch_metadata(property_id)
+        )
+
+    async def _fetch_metadata(self, property_id: str) -> GAMetadata:
+        """Fetch metadata from the Data API and cache it (uncached)."""
+        cache_key = f"metadata:{property_id}"
+        data_client = self._get_data_client()
 
         try:
-            metadata = self._data_client.get_metadata(
-                name=f"properties/{property_id}/metadata"
+            metadata = await asyncio.to_thread(
+                data_client.get_metadata,
+                name=f"properties/{property_id}/metadata",
             )
 
             dimensions = []
@@ -262,12 +587,121 @@ class GAClient:
                 custom_metrics=custom_metrics,
             )
 
-            self._set_cached(cache_key, result, self.property_cache_ttl)
+            self._set_cached(cache_key, result, category="metadata")
             return result
 
         except GoogleAPIError as e:
             raise GAClientError(f"Failed to get metadata for property {property_id}: {e}")
 
+    async def _run_report_pages(
+        self,
+        property_id: str,
+        metrics: List[str],
+        start_date: str,
+        end_date: str,
+        dimensions: Optional[List[str]],
+        filters: Optional[List[Dict[str, Any]]],
+        order_by: Optional[Dict[str, Any]],
+        limit: int,
+        page_size: int,
+    ) -> AsyncIterator[Tuple[Any, List[str], List[str], List[Dict[str, Any]]]]:
+        """
+        Run a GA4 report one page at a time, paging by offset.
+
+        Yields:
+            Tuple of (response, dimension_headers, metric_headers, rows)
+            for each page. At least one page is always yielded.
+        """
+        from google.analytics.data_v1beta.types import (
+            DateRange,
+            Dimension,
+            Metric,
+            RunReportRequest,
+        )
+
+        data_client = self._get_data_client()
+        page_size = min(limit, page_size)
+
+        request = RunReportRequest(
+            property=f"properties/{property_id}",
+            metrics=[Metric(name=m) for m in metrics],
+            date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
+        )
+
+        if dimensions:
+            request.dimensions = [Dimension(name=d) for d in dimensions]
+
+        if filters:
+            request.dimension_filter = self._build_filter_expression(filters)
+
+        if order_by:
+            request.order_bys = [self._build_order_by(order_by, metrics)]
+
+        offset = 0
+        while True:
+            request.offset = offset
+            request.limit = min(page_size, limit - offset)
+
+            try:
+                response = await asyncio.to_thread(
+                    data_client.run_report, request=request
+                )
+            except GoogleAPIError as e:
+                raise GAClientError(f"Report failed for property {property_id}: {e}")
+
+            dimension_headers, metric_headers, rows = _format_rows(response)
+            yield response, dimension_headers, metric_headers, rows
+
+            offset += len(rows)
+            if (
+                len(rows) < request.limit
+                or offset >= limit
+                or offset >= response.row_count
+            ):
+                break
+
+    async def iter_report_rows(
+        self,
+        property_id: str,
+        metrics: List[str],
+        start_date: str,
+        end_date: str,
+        dimensions: Optional[List[str]] = None,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        order_by: Optional[Dict[str, Any]] = None,
+        limit: int = 1000,
+        page_size: int = 10000,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run a GA4 report and yield its rows one at a time.
+
+        Rows are fetched in pages of page_size, so only one page is held
+        in memory and callers can stop early without fetching the rest.
+
+        Args:
+            property_id: The GA4 property ID
+            metrics: List of metric names (e.g., ["activeUsers", "sessions"])
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            dimensions: Optional list of dimension names
+            filters: Optional list of filter conditions
+            order_by: Optional ordering specification
+            limit: Maximum rows to return
+            page_size: Maximum rows fetched per API request
+
+        Yields:
+            Dict mapping dimension and metric names to values for each row
+
+        Raises:
+            GAClientError: If the report fails
+        """
+        async for *_, rows in self._run_report_pages(
+            property_id, metrics, start_date, end_date,
+            dimensions, filters, order_by, limit, page_size,
+        ):
+            for row in rows:
+                yield row
+
     async def run_report(
         self,
         property_id: str,
@@ -298,63 +732,36 @@ class GAClient:
         Raises:
             GAClientError: If the report fails
         """
-        self._initialize()
-
-        try:
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                metrics=[Metric(name=m) for m in metrics],
-                date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-                limit=limit,
-            )
-
-            if dimensions:
-                request.dimensions = [Dimension(name=d) for d in dimensions]
-
-            if filters:
-                request.dimension_filter = self._build_filter_expression(filters)
-
-            if order_by:
-                request.order_bys = [self._build_order_by(order_by, metrics)]
-
-            response = self._data_client.run_report(request=request)
-
-            # Format response
-            rows = []
-            dimension_headers = [h.name for h in response.dimension_headers]
-            metric_headers = [h.name for h in response.metric_headers]
-
-            for row in response.rows:
-                row_data = {}
-
-                for i, dim_value in enumerate(row.dimension_values):
-                    row_data[dimension_headers[i]] = dim_value.value
-
-                for i, metric_value in enumerate(row.metric_values):
-                    value = metric_value.value
-                    # Try to convert to number
-                    try:
-                        if "." in value:
-                            row_data[metric_headers[i]] = float(value)
-                        else:
-                            row_data[metric_headers[i]] = int(value)
-                    except ValueError:
-                        row_data[metric_headers[i]] = value
-
-                rows.append(row_data)
-
-            return {
-                "property_id": property_id,
-                "date_range": {"start_date": start_date, "end_date": end_date},
-                "dimensions": dimension_headers,
-                "metrics": metric_headers,
-                "rows": rows,
-                "row_count": len(rows),
-                "total_rows": response.row_count,
-            }
+        cache_key = _report_cache_key(
+            property_id, metrics, start_date, end_date,
+            dimensions, filters, order_by, limit,
+        )
+        if cached := self._get_cached(cache_key):
+            # Callers annotate the result dict, so hand out a copy
+            return dict(cached)
+
+        rows: List[Dict[str, Any]] = []
+        async for page in self._run_report_pages(
+            property_id, metrics, start_date, end_date,
+            dimensions, filters, order_by, limit, page_size=10000,
+        ):
+            response, dimension_headers, metric_headers, page_rows = page
+            rows.extend(page_rows)
+
+        result = {
+            "property_id": property_id,
+            "date_range": {"start_date": start_date, "end_date": end_date},
+            "dimensions": dimension_headers,
+            "metrics": metric_headers,
+            "rows": rows,
+            "row_count": len(rows),
+            "total_rows": response.row_count,
+        }
 
-        except GoogleAPIError as e:
-            raise GAClientError(f"Report failed for property {property_id}: {e}")
+        if len(rows) <= _MAX_CACHED_REPORT_ROWS:
+            category = "live_report" if _includes_today(end_date) else "report"
+            self._set_cached(cache_key, result, category=category)
+        return dict(result)
 
     async def run_realtime_report(
         self,
@@ -378,7 +785,13 @@ class GAClient:
         Raises:
             GAClientError: If the report fails
         """
-        self._initialize()
+        from google.analytics.data_v1beta.types import (
+            Dimension,
+            Metric,
+            RunRealtimeReportRequest,
+        )
+
+        data_client = self._get_data_client()
 
         if not metrics:
             metrics = ["activeUsers"]
@@ -393,30 +806,8 @@ class GAClient:
             if dimensions:
                 request.dimensions = [Dimension(name=d) for d in dimensions]
 
-            response = self._data_client.run_realtime_report(request=request)
-
-            # Format response
-            rows = []
-            dimension_headers = [h.name for h in response.dimension_headers]
-            metric_headers = [h.name for h in response.metric_headers]
-
-            for row in response.rows:
-                row_data = {}
-
-                for i, dim_value in enumerate(row.dimension_values):
-                    row_data[dimension_headers[i]] = dim_value.value
-
-                for i, metric_value in enumerate(row.metric_values):
-                    value = metric_value.value
-                    try:
-                        if "." in value:
-                            row_data[metric_headers[i]] = float(value)
-                        else:
-                            row_data[metric_headers[i]] = int(value)
-                    except ValueError:
-                        row_data[metric_headers[i]] = value
-
-                rows.append(row_data)
+            response = data_client.run_realtime_report(request=request)
+            dimension_headers, metric_headers, rows = _format_rows(response)
 
             return {
                 "property_id": property_id,
@@ -432,8 +823,13 @@ class GAClient:
 
     def _build_filter_expression(
         self, filters: List[Dict[str, Any]]
-    ) -> FilterExpression:
+    ) -> "FilterExpression":
         """Build a filter expression from a list of filter conditions."""
+        from google.analytics.data_v1beta.types import (
+            FilterExpression,
+            FilterExpressionList,
+        )
+
         if len(filters) == 1:
             return FilterExpression(filter=self._build_single_filter(filters[0]))
 
@@ -444,31 +840,23 @@ class GAClient:
             and_group=FilterExpressionList(expressions=filter_expressions)
         )
 
-    def _build_single_filter(self, filter_spec: Dict[str, Any]) -> Filter:
+    def _build_single_filter(self, filter_spec: Dict[str, Any]) -> "Filter":
         """Build a single filter from a specification."""
+        from google.analytics.data_v1beta.types import Filter, NumericValue
+
         field = filter_spec.get("field", "")
         operator = filter_spec.get("operator", "EXACT").upper()
         value = filter_spec.get("value", "")
 
         filter_obj = Filter(field_name=field)
 
-        if operator in ("EXACT", "CONTAINS", "BEGINS_WITH", "ENDS_WITH", "REGEXP"):
-            match_type_map = {
-                "EXACT": Filter.StringFilter.MatchType.EXACT,
-                "CONTAINS": Filter.StringFilter.MatchType.CONTAINS,
-                "BEGINS_WITH": Filter.StringFilter.MatchType.BEGINS_WITH,
-                "ENDS_WITH": Filter.StringFilter.MatchType.ENDS_WITH,
-                "REGEXP": Filter.StringFilter.MatchType.FULL_REGEXP,
-            }
+        if operator in _STRING_OPS:
+            match_type_map, _ = _filter_op_maps()
             filter_obj.string_filter = Filter.StringFilter(
                 match_type=match_type_map[operator], value=str(value)
             )
-        elif operator in ("GREATER_THAN", "LESS_THAN", "EQUAL"):
-            op_map = {
-                "GREATER_THAN": Filter.NumericFilter.Operation.GREATER_THAN,
-                "LESS_THAN": Filter.NumericFilter.Operation.LESS_THAN,
-                "EQUAL": Filter.NumericFilter.Operation.EQUAL,
-            }
+        elif operator in _NUMERIC_OPS:
+            _, op_map = _filter_op_maps()
             filter_obj.numeric_filter = Filter.NumericFilter(
                 operation=op_map[operator],
                 value=NumericValue(double_value=float(value)),
@@ -483,8 +871,10 @@ class GAClient:
 
     def _build_order_by(
         self, order_spec: Dict[str, Any], metrics: List[str]
-    ) -> OrderBy:
+    ) -> "OrderBy":
         """Build an order by specification."""
+        from google.analytics.data_v1beta.types import OrderBy
+
         field = order_spec.get("field", "")
         desc = order_spec.get("desc", True)
 
@@ -500,8 +890,10 @@ class GAClient:
         Clear cached data.
 
         Args:
-            pattern: Optional pattern to match cache keys (e.g., "metadata:")
-                    If not provided, clears all cache.
+            pattern: Optional pattern to match cache keys (e.g., "metadata:").
+                    Plain patterns match any key containing them; patterns
+                    with glob characters (*, ?, [) must match the whole key
+                    (e.g., "report:123:*"). If not provided, clears all cache.
 
         Returns:
             int: Number of cache entries cleared
@@ -511,36 +903,55 @@ class GAClient:
             self._cache.clear()
             return count
 
-        keys_to_remove = [k for k in self._cache if pattern in k]
+        if any(c in pattern for c in "*?["):
+            matches = re.compile(fnmatch.translate(pattern)).match
+            keys_to_remove = [k for k in self._cache if matches(k)]
+        else:
+            keys_to_remove = [k for k in self._cache if pattern in k]
+        for key in keys_to_remove:
+            del self._cache[key]
+        return len(keys_to_remove)
+
+    def invalidate(self, property_id: str) -> int:
+        """
+        Drop all cached data for a single property.
+
+        Matches keys with the property ID as a ':'-separated segment
+        (e.g. "metadata:123"), so other properties' entries are kept.
+
+        Args:
+            property_id: The GA4 property ID
+
+        Returns:
+            int: Number of cache entries removed
+        """
+        keys_to_remove = [k for k in self._cache if property_id in k.split(":")]
         for key in keys_to_remove:
             del self._cache[key]
         return len(keys_to_remove)
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        valid_entries = sum(1 for e in self._cache.values() if e.is_valid())
+        now = time.monotonic()
+        valid_entries = sum(1 for e in self._cache.values() if e.is_valid(now))
 
         return {
             "total_entries": len(self._cache),
             "valid_entries": valid_entries,
             "expired_entries": len(self._cache) - valid_entries,
+            "max_entries": self.cache_max_entries,
             "cache_keys": list(self._cache.keys()),
         }
 
 
-# Global client instance (lazy loaded)
-_client: Optional[GAClient] = None
-
-
+@functools.cache
 def get_ga_client() -> GAClient:
-    """Get the global GA client instance."""
-    global _client
-    if _client is None:
-        _client = GAClient()
-    return _client
+    """Get the global GA client instance (created on first call)."""
+    return GAClient()
 
 
 def reset_ga_client() -> None:
-    """Reset the global GA client (useful for testing)."""
-    global _client
-    _client = None
+    """Close and reset the global GA client (on shutdown and in tests)."""
+    if get_ga_client.cache_info().currsize:
+        get_ga_client().close()
+    get_ga_client.cache_clear()
@@ -5,12 +5,62 @@ Enables LLMs to reference properties by natural language names
 rather than requiring exact property IDs.
 """
 
-from dataclasses import dataclass
+import asyncio
+import functools
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 from .config import get_config
-from .ga_client import GAClient, GAProperty, get_ga_client
+from .ga_client import GAClient, GAProperty, get_ga_client, normalize_name
+
+try:
+    from rapidfuzz.fuzz import ratio as _rapidfuzz_ratio
+    from rapidfuzz.process import extract as _rapidfuzz_extract
+except ImportError:  # rapidfuzz is an optional speedup (the "fast" extra)
+    _rapidfuzz_ratio = None
+    _rapidfuzz_extract = None
+
+# Maximum number of memoized resolve() results
+_RESOLVE_MEMO_SIZE = 512
+
+# Minimum score for a property to appear in search() results
+_SEARCH_THRESHOLD = 0.3
+
+
+def _similarities(query: str, choices: List[str], cutoff: float) -> List[float]:
+    """
+    Similarity ratios (0.0 to 1.0) between a query and each choice, in order.
+
+    Scores are always difflib's SequenceMatcher.ratio(). Choices that cannot
+    score above the cutoff may be reported as 0.0 instead, so callers must
+    only compare scores with ``> cutoff``.
+
+    When RapidFuzz is installed it is used as a prefilter: its Indel ratio is
+    an upper bound on SequenceMatcher.ratio(), so only the choices it keeps
+    above the cutoff are re-scored with difflib, and results are the same
+    with or without it.
+    """
+    if _rapidfuzz_extract is None:
+        return [SequenceMatcher(None, query, choice).ratio() for choice in choices]
+
+    scores = [0.0] * len(choices)
+    # Slightly below the cutoff so float rounding never drops a survivor
+    for choice, _, index in _rapidfuzz_extract(
+        query,
+        choices,
+        scorer=_rapidfuzz_ratio,
+        limit=None,
+        score_cutoff=max(cutoff * 100 - 1e-6, 0),
+    ):
+        scores[index] = SequenceMatcher(None, query, choice).ratio()
+    return scores
+
+
+def _max_ratio(len_a: int, len_b: int) -> float:
+    """Upper bound of SequenceMatcher.ratio() for strings of these lengths."""
+    return 2 * min(len_a, len_b) / (len_a + len_b)
 
 
 @dataclass
@@ -30,6 +80,14 @@ class PropertyMatch:
         }
 
 
+@dataclass
+class ResolveResult:
+    """Result of resolve_with_suggestions()."""
+    match: Optional[PropertyMatch]
+    # Closest properties by search ranking, only filled when match is None
+    suggestions: List[PropertyMatch] = field(default_factory=list)
+
+
 class PropertyResolver:
     """
     Resolves property names to GA4 property IDs with fuzzy matching.
@@ -60,11 +118,71 @@ class PropertyResolver:
         self.fuzzy_threshold = fuzzy_threshold or config.fuzzy_threshold
         self.custom_aliases = custom_aliases or config.custom_aliases
         self._properties: Optional[List[GAProperty]] = None
+        # Exact-match indexes over the loaded properties
+        self._by_id: Dict[str, GAProperty] = {}
+        self._by_name: Dict[str, GAProperty] = {}
+        self._by_display: Dict[str, GAProperty] = {}
+        # Lowercased alias -> the first of its targets that exists
+        self._alias_to_prop: Dict[str, GAProperty] = {}
+        # Normalized names and display names, in property order, passed to
+        # the similarity scorer as-is (no per-call preprocessing)
+        self._name_choices: List[str] = []
+        self._display_choices: List[str] = []
+        # First character of name/display_clean -> property positions,
+        # used to narrow fuzzy scoring to plausible candidates
+        self._by_first_char: Dict[str, Set[int]] = {}
+        # to_dict() of every loaded property, built on first list_all_dicts()
+        self._property_dicts: Optional[List[Dict[str, Any]]] = None
+        # LRU memo of resolve() results for the loaded property list
+        self._resolve_memo: "OrderedDict[str, Optional[PropertyMatch]]" = OrderedDict()
 
     async def _ensure_properties_loaded(self) -> None:
         """Ensure properties are loaded from the GA API."""
         if self._properties is None:
             self._properties = await self.client.discover_properties()
+            self._build_indexes()
+            self._property_dicts = None
+            self._resolve_memo.clear()
+
+    def _build_indexes(self) -> None:
+        """Build the exact-match and alias lookup tables (first match wins)."""
+        self._by_id = {}
+        self._by_name = {}
+        self._by_display = {}
+        self._by_first_char = {}
+        self._name_choices = [p.name for p in self._properties or []]
+        self._display_choices = [p.display_clean for p in self._properties or []]
+        for i, prop in enumerate(self._properties or []):
+            self._by_id.setdefault(prop.id, prop)
+            self._by_name.setdefault(prop.name, prop)
+            self._by_display.setdefault(prop.display_lower, prop)
+            for key in (prop.name[:1], prop.display_clean[:1]):
+                self._by_first_char.setdefault(key, set()).add(i)
+
+        self._alias_to_prop = {}
+        for prop_name, aliases in self.custom_aliases.items():
+            # Find the property with this name
+            prop = self._by_name.get(prop_name) or self._by_display.get(prop_name.lower())
+            if prop is None:
+                continue
+            for alias in aliases:
+                self._alias_to_prop.setdefault(alias.lower(), prop)
+
+    async def warm(self, property_ids: List[str]) -> None:
+        """
+        Load the property list and metadata for the given properties concurrently.
+
+        Use this before resolving names when the caller already knows which
+        properties it will query, so discovery and metadata requests overlap
+        instead of running one after another.
+
+        Args:
+            property_ids: GA4 property IDs whose metadata should be cached
+        """
+        await asyncio.gather(
+            self._ensure_properties_loaded(),
+            *(self.client.get_metadata(pid) for pid in property_ids),
+        )
 
     async def resolve(self, query: str) -> Optional[PropertyMatch]:
         """
@@ -88,58 +206,193 @@ class PropertyResolver:
         if not self._properties:
             return None
 
+        if query in self._resolve_memo:
+            self._resolve_memo.move_to_end(query)
+            return self._resolve_memo[query]
+
+        match = self._match(query)
+        self._remember(query, match)
+        return match
+
+    async def resolve_with_suggestions(
+        self, query: str, max_suggestions: int = 3
+    ) -> ResolveResult:
+        """
+        Resolve a query, returning search suggestions when nothing matches.
+
+        Equivalent to resolve() followed by search() on a miss, but the
+        fuzzy scores are computed once and shared by both steps.
+
+        Args:
+            query: The property name, ID, or alias to resolve
+            max_suggestions: Maximum number of suggestions on a miss
+
+        Returns:
+            ResolveResult with the match, or with suggestions if none was found
+        """
+        await self._ensure_properties_loaded()
+
+        if not self._properties:
+            return ResolveResult(match=None)
+
         query_lower = query.lower().strip()
-        query_clean = "".join(c for c in query_lower if c.isalnum())
+        query_clean = normalize_name(query_lower)
+
+        if query in self._resolve_memo:
+            self._resolve_memo.move_to_end(query)
+            match = self._resolve_memo[query]
+            if match:
+                return ResolveResult(match=match)
+            scores = self._score_all(query_clean, _SEARCH_THRESHOLD)
+        else:
+            match = self._match_exact(query, query_lower, query_clean)
+            scores = None
+            if match is None:
+                # Shared with _rank(), so keep everything either step can use
+                scores = self._score_all(
+                    query_clean, min(self.fuzzy_threshold, _SEARCH_THRESHOLD)
+                )
+                match = self._match_fuzzy(query_clean, scores)
+            self._remember(query, match)
+            if match:
+                return ResolveResult(match=match)
+
+        return ResolveResult(
+            match=None,
+            suggestions=self._rank(query, query_clean, scores, max_suggestions),
+        )
+
+    def _remember(self, query: str, match: Optional[PropertyMatch]) -> None:
+        """Memoize a resolve() result, evicting the least recently used."""
+        self._resolve_memo[query] = match
+        if len(self._resolve_memo) > _RESOLVE_MEMO_SIZE:
+            self._resolve_memo.popitem(last=False)
+
+    def _fuzzy_candidates(self, query_clean: str) -> Optional[Set[int]]:
+        """
+        Positions of properties to fuzzy-score first against a query.
+
+        Picks properties whose name or display name starts with the query's
+        first character or one of its neighbours (for small typos). Their
+        best score lets _match_fuzzy() skip the other properties that
+        cannot reach it.
 
+        Returns:
+            Set of positions in the property list, or None to score all
+        """
+        if not query_clean:
+            return None
+        first = ord(query_clean[0])
+        candidates: Set[int] = set()
+        for code in (first - 1, first, first + 1):
+            candidates |= self._by_first_char.get(chr(code), set())
+        return candidates or None
+
+    def _score_all(
+        self, query_clean: str, cutoff: float
+    ) -> Tuple[List[float], List[float]]:
+        """
+        Similarity of a query to every property's name and display name.
+
+        Scores at or below the cutoff may be reported as 0.0 (see _similarities).
+        """
+        return (
+            _similarities(query_clean, self._name_choices, cutoff),
+            _similarities(query_clean, self._display_choices, cutoff),
+        )
+
+    def _match(self, query: str) -> Optional[PropertyMatch]:
+        """Resolve a query against the loaded properties (uncached)."""
+        query_lower = query.lower().strip()
+        query_clean = normalize_name(query_lower)
+
+        return (
+            self._match_exact(query, query_lower, query_clean)
+            or self._match_fuzzy(query_clean)
+        )
+
+    def _match_exact(
+        self, query: str, query_lower: str, query_clean: str
+    ) -> Optional[PropertyMatch]:
+        """Resolution steps 1-4: ID, name, display name and alias lookups."""
         # 1. Exact match on property ID
-        for prop in self._properties:
-            if prop.id == query:
-                return PropertyMatch(
-                    property=prop, confidence=1.0, matched_on="exact_id"
-                )
+        if prop := self._by_id.get(query):
+            return PropertyMatch(property=prop, confidence=1.0, matched_on="exact_id")
 
         # 2. Exact match on property name (cleaned)
-        for prop in self._properties:
-            if prop.name == query_clean:
-                return PropertyMatch(
-                    property=prop, confidence=1.0, matched_on="exact_name"
-                )
+        if prop := self._by_name.get(query_clean):
+            return PropertyMatch(property=prop, confidence=1.0, matched_on="exact_name")
 
         # 3. Match on display name
-        for prop in self._properties:
-            if prop.display_name.lower() == query_lower:
-                return PropertyMatch(
-                    property=prop, confidence=1.0, matched_on="display_name"
-                )
+        if prop := self._by_display.get(query_lower):
+            return PropertyMatch(property=prop, confidence=1.0, matched_on="display_name")
 
         # 4. Match on custom aliases
-        for prop_name, aliases in self.custom_aliases.items():
-            if query_lower in [a.lower() for a in aliases]:
-                # Find the property with this name
-                for prop in self._properties:
-                    if prop.name == prop_name or prop.display_name.lower() == prop_name.lower():
-                        return PropertyMatch(
-                            property=prop, confidence=1.0, matched_on="alias"
-                        )
-
-        # 5. Fuzzy matching
-        best_match: Optional[Tuple[GAProperty, float, str]] = None
+        if prop := self._alias_to_prop.get(query_lower):
+            return PropertyMatch(property=prop, confidence=1.0, matched_on="alias")
 
-        for prop in self._properties:
-            # Try matching against name
-            name_score = SequenceMatcher(None, query_clean, prop.name).ratio()
-            if name_score > self.fuzzy_threshold:
-                if best_match is None or name_score > best_match[1]:
-                    best_match = (prop, name_score, "fuzzy_name")
+        return None
+
+    def _match_fuzzy(
+        self,
+        query_clean: str,
+        scores: Optional[Tuple[List[float], List[float]]] = None,
+    ) -> Optional[PropertyMatch]:
+        """
+        Resolution step 5: best fuzzy or partial match above the threshold.
 
-            # Try matching against display name
-            display_clean = "".join(
-                c for c in prop.display_name.lower() if c.isalnum()
+        Args:
+            query_clean: Normalized query
+            scores: Precomputed _score_all() result; if omitted, the
+                    first-character candidates are scored first and the
+                    rest only when their length lets them match or beat
+                    the best candidate
+        """
+        best_match: Optional[Tuple[GAProperty, float, str]] = None
+        candidates = self._fuzzy_candidates(query_clean)
+        positions = (
+            range(len(self._properties)) if candidates is None else sorted(candidates)
+        )
+        name_scores, display_scores = self._scores_at(query_clean, positions, scores)
+        if candidates is not None:
+            # Properties outside the first-character buckets can still win,
+            # so score every one whose length allows it to reach the best
+            # bucket score (ties included, since earlier properties win)
+            floor = max(
+                self.fuzzy_threshold,
+                *name_scores.values(),
+                *display_scores.values(),
             )
-            display_score = SequenceMatcher(None, query_clean, display_clean).ratio()
-            if display_score > self.fuzzy_threshold:
-                if best_match is None or display_score > best_match[1]:
-                    best_match = (prop, display_score, "fuzzy_display")
+            query_len = len(query_clean)
+            rest = [
+                i for i in range(len(self._properties))
+                if i not in candidates and (
+                    _max_ratio(query_len, len(self._name_choices[i])) >= floor
+                    or _max_ratio(query_len, len(self._display_choices[i])) >= floor
+                )
+            ]
+            if rest:
+                rest_name_scores, rest_display_scores = self._scores_at(
+                    query_clean, rest, scores
+                )
+                name_scores.update(rest_name_scores)
+                display_scores.update(rest_display_scores)
+
+        for i, prop in enumerate(self._properties):
+            display_clean = prop.display_clean
+
+            if i in name_scores:
+                # Try matching against name
+                name_score = name_scores[i]
+                if name_score > self.fuzzy_threshold:
+                    if best_match is None or name_score > best_match[1]:
+                        best_match = (prop, name_score, "fuzzy_name")
+
+                # Try matching against display name
+                display_score = display_scores[i]
+                if display_score > self.fuzzy_threshold:
+                    if best_match is None or display_score > best_match[1]:
+                        best_match = (prop, display_score, "fuzzy_display")
 
             # Try partial matching (query contained in name)
             if query_clean in prop.name or query_clean in display_clean:
@@ -158,6 +411,31 @@ class PropertyResolver:
 
         return None
 
+    def _scores_at(
+        self,
+        query_clean: str,
+        positions: Sequence[int],
+        scores: Optional[Tuple[List[float], List[float]]],
+    ) -> Tuple[Dict[int, float], Dict[int, float]]:
+        """Name and display-name scores for some properties, keyed by position."""
+        if scores is not None:
+            return (
+                {i: scores[0][i] for i in positions},
+                {i: scores[1][i] for i in positions},
+            )
+        name_choices = [self._name_choices[i] for i in positions]
+        display_choices = [self._display_choices[i] for i in positions]
+        return (
+            dict(zip(
+                positions,
+                _similarities(query_clean, name_choices, self.fuzzy_threshold),
+            )),
+            dict(zip(
+                positions,
+                _similarities(query_clean, display_choices, self.fuzzy_threshold),
+            )),
+        )
+
     async def search(self, query: str, max_results: int = 5) -> List[PropertyMatch]:
         """
         Search for properties matching a query.
@@ -177,11 +455,26 @@ class PropertyResolver:
             return []
 
         query_lower = query.lower().strip()
-        query_clean = "".join(c for c in query_lower if c.isalnum())
+        query_clean = normalize_name(query_lower)
+
+        return self._rank(
+            query, query_clean, self._score_all(query_clean, _SEARCH_THRESHOLD), max_results
+        )
 
+    def _rank(
+        self,
+        query: str,
+        query_clean: str,
+        scores: Tuple[List[float], List[float]],
+        max_results: int,
+    ) -> List[PropertyMatch]:
+        """Rank all properties against a query using _score_all() scores."""
         matches: List[PropertyMatch] = []
+        name_scores, display_scores = scores
 
-        for prop in self._properties:
+        for prop, name_score, display_score in zip(
+            self._properties, name_scores, display_scores
+        ):
             # Check for exact matches
             if prop.id == query or prop.name == query_clean:
                 matches.append(
@@ -189,13 +482,8 @@ class PropertyResolver:
                 )
                 continue
 
-            # Calculate fuzzy score
-            name_score = SequenceMatcher(None, query_clean, prop.name).ratio()
-            display_clean = "".join(
-                c for c in prop.display_name.lower() if c.isalnum()
-            )
-            display_score = SequenceMatcher(None, query_clean, display_clean).ratio()
-
+            # Best fuzzy score
+            display_clean = prop.display_clean
             best_score = max(name_score, display_score)
 
             # Also check partial matches
@@ -203,7 +491,7 @@ class PropertyResolver:
                 partial_score = 0.7 + (len(query_clean) / max(len(prop.name), len(display_clean), 1)) * 0.3
                 best_score = max(best_score, partial_score)
 
-            if best_score > 0.3:  # Lower threshold for search
+            if best_score > _SEARCH_THRESHOLD:  # Lower threshold for search
                 matches.append(
                     PropertyMatch(
                         property=prop,
@@ -239,24 +527,41 @@ class PropertyResolver:
         await self._ensure_properties_loaded()
         return self._properties or []
 
-    def clear_cache(self) -> None:
-        """Clear the cached property list."""
-        self._properties = None
-
+    async def list_all_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Get all available properties as dicts (see GAProperty.to_dict).
 
-# Global resolver instance
-_resolver: Optional[PropertyResolver] = None
+        The dicts are built once per loaded property list and shared
+        between calls, so callers must not modify them.
 
+        Returns:
+            List of property dicts
+        """
+        await self._ensure_properties_loaded()
+        if self._property_dicts is None:
+            self._property_dicts = [p.to_dict() for p in self._properties or []]
+        return list(self._property_dicts)
 
+    def clear_cache(self) -> None:
+        """Clear the cached property list, indexes and memoized resolutions."""
+        self._properties = None
+        self._property_dicts = None
+        self._by_id = {}
+        self._by_name = {}
+        self._by_display = {}
+        self._alias_to_prop = {}
+        self._name_choices = []
+        self._display_choices = []
+        self._by_first_char = {}
+        self._resolve_memo.clear()
+
+
+@functools.cache
 def get_property_resolver() -> PropertyResolver:
-    """Get the global property resolver instance."""
-    global _resolver
-    if _resolver is None:
-        _resolver = PropertyResolver()
-    return _resolver
+    """Get the global property resolver instance (created on first call)."""
+    return PropertyResolver()
 
 
 def reset_property_resolver() -> None:
     """Reset the global property resolver."""
-    global _resolver
-    _resolver = None
+    get_property_resolver.cache_clear()
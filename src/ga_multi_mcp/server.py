@@ -5,18 +5,31 @@ An MCP server providing tools for querying Google Analytics 4 data
 across multiple properties with fuzzy name matching.
 """
 
+import asyncio
 import logging
 import sys
-from typing import Annotated, Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional
 
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 from pydantic import Field
 
-from .config import ConfigError
+from .config import ConfigError, get_config
 from .date_parser import DateParseError, get_date_range_description, parse_date_range
-from .ga_client import GAClientError, get_ga_client
-from .property_resolver import get_property_resolver
+from .ga_client import (
+    GAClientError,
+    GAMetadata,
+    GAProperty,
+    get_ga_client,
+    reset_ga_client,
+)
+from .property_resolver import get_property_resolver, reset_property_resolver
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (the "fast" extra)
+    orjson = None
 
 # Configure logging to stderr (stdout reserved for MCP protocol)
 logging.basicConfig(
@@ -30,6 +43,46 @@ logger = logging.getLogger(__name__)
 logging.getLogger("google.auth").setLevel(logging.ERROR)
 logging.getLogger("googleapiclient.discovery_cache").setLevel(logging.ERROR)
 
+# Max concurrent report requests per multi-property query (stays under GA quota)
+_MAX_CONCURRENT_REPORTS = 10
+
+# Max concurrent metadata requests per bulk metadata query
+_MAX_CONCURRENT_METADATA = 8
+
+# Metric value types that count towards multi-property totals
+_NUMERIC_TYPES = frozenset((int, float))
+
+
+def _serialize_tool_result(data: Any) -> str:
+    """Serialize a tool result to JSON text with orjson."""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _metadata_result(prop: GAProperty, metadata: GAMetadata) -> Dict[str, Any]:
+    """Build the metadata tool response for one property."""
+    return {
+        "property_id": prop.id,
+        "property_name": prop.display_name,
+        "dimensions": metadata.dimensions,
+        "metrics": metadata.metrics,
+        "custom_dimensions": metadata.custom_dimensions,
+        "custom_metrics": metadata.custom_metrics,
+        "total_dimensions": len(metadata.dimensions) + len(metadata.custom_dimensions),
+        "total_metrics": len(metadata.metrics) + len(metadata.custom_metrics),
+    }
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """Close the GA client's API connections when the server shuts down."""
+    try:
+        yield {}
+    finally:
+        # The resolver holds the client, so drop both for the next session
+        reset_property_resolver()
+        reset_ga_client()
+
+
 # Initialize FastMCP server
 mcp = FastMCP(
     name="GA Multi MCP",
@@ -46,6 +99,9 @@ mcp = FastMCP(
     Common metrics: activeUsers, sessions, screenPageViews, eventCount, bounceRate
     Common dimensions: date, country, city, deviceCategory, browser, pagePath
     """,
+    # FastMCP's default serializer is used when orjson is not installed
+    tool_serializer=_serialize_tool_result if orjson is not None else None,
+    lifespan=_lifespan,
 )
 
 
@@ -63,14 +119,12 @@ async def list_properties() -> Dict[str, Any]:
     """
     try:
         resolver = get_property_resolver()
-        properties = await resolver.list_all()
+        properties = await resolver.list_all_dicts()
 
         return {
-            "properties": [p.to_dict() for p in properties],
+            "properties": properties,
             "count": len(properties),
         }
-    except ConfigError as e:
-        raise ToolError(f"Configuration error: {e}")
     except GAClientError as e:
         raise ToolError(f"Failed to list properties: {e}")
 
@@ -105,8 +159,6 @@ async def search_properties(
             result["best_match"] = matches[0].to_dict()
 
         return result
-    except ConfigError as e:
-        raise ToolError(f"Configuration error: {e}")
     except GAClientError as e:
         raise ToolError(f"Search failed: {e}")
 
@@ -144,12 +196,11 @@ async def query_analytics(
     try:
         # Resolve property name
         resolver = get_property_resolver()
-        match = await resolver.resolve(property)
+        resolution = await resolver.resolve_with_suggestions(property, max_suggestions=3)
+        match = resolution.match
 
         if not match:
-            # Get suggestions
-            suggestions = await resolver.search(property, max_results=3)
-            suggestion_names = [s.property.display_name for s in suggestions]
+            suggestion_names = [s.property.display_name for s in resolution.suggestions]
             raise ToolError(
                 f"Property '{property}' not found. "
                 f"Did you mean: {', '.join(suggestion_names) if suggestion_names else 'No similar properties found'}"
@@ -184,8 +235,6 @@ async def query_analytics(
 
         return result
 
-    except ConfigError as e:
-        raise ToolError(f"Configuration error: {e}")
     except GAClientError as e:
         raise ToolError(f"Query failed: {e}")
 
@@ -214,80 +263,92 @@ async def query_multiple_properties(
     Returns:
         Dict with results per property and aggregated summary
     """
+    # Parse dates
     try:
-        # Parse dates
-        try:
-            start, end = parse_date_range(start_date, end_date)
-        except DateParseError as e:
-            raise ToolError(str(e))
-
-        resolver = get_property_resolver()
-        client = get_ga_client()
-
-        results = []
-        errors = []
-        totals: Dict[str, float] = {m: 0 for m in metrics}
-
-        for prop_name in properties:
-            match = await resolver.resolve(prop_name)
-
-            if not match:
-                errors.append({
-                    "property": prop_name,
-                    "error": "Property not found",
-                })
-                continue
-
-            try:
-                result = await client.run_report(
-                    property_id=match.property.id,
-                    metrics=metrics,
-                    start_date=start,
-                    end_date=end,
-                    dimensions=dimensions,
-                    limit=1000,
-                )
-
-                # Calculate totals from first row (summary)
-                if result["rows"] and not dimensions:
-                    for metric in metrics:
-                        if metric in result["rows"][0]:
-                            val = result["rows"][0][metric]
-                            if isinstance(val, (int, float)):
-                                totals[metric] += val
-
-                results.append({
-                    "property_id": match.property.id,
-                    "property_name": match.property.display_name,
-                    "data": result["rows"],
-                    "row_count": result["row_count"],
-                })
-
-            except GAClientError as e:
-                errors.append({
-                    "property": match.property.display_name,
-                    "error": str(e),
-                })
+        start, end = parse_date_range(start_date, end_date)
+    except DateParseError as e:
+        raise ToolError(str(e))
+
+    resolver = get_property_resolver()
+    client = get_ga_client()
+
+    results = []
+    errors = []
+    totals: Dict[str, float] = {m: 0 for m in metrics}
+
+    # Resolve all properties, then run their reports concurrently
+    matches = await asyncio.gather(*(resolver.resolve(p) for p in properties))
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REPORTS)
+
+    async def run_property_report(property_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await client.run_report(
+                property_id=property_id,
+                metrics=metrics,
+                start_date=start,
+                end_date=end,
+                dimensions=dimensions,
+                limit=1000,
+            )
 
-        return {
-            "date_range": {
-                "start_date": start,
-                "end_date": end,
-                "description": get_date_range_description(start, end),
-            },
-            "metrics": metrics,
-            "dimensions": dimensions or [],
-            "results": results,
-            "errors": errors if errors else None,
-            "summary": {
-                "properties_queried": len(properties),
-                "properties_successful": len(results),
-                "totals": totals if not dimensions else None,
-            },
-        }
+    reports = iter(
+        await asyncio.gather(
+            *(run_property_report(m.property.id) for m in matches if m),
+            return_exceptions=True,
+        )
+    )
 
-    except ConfigError as e:
-        raise ToolError(f"Configuration error: {e}")
+    # Collect results in the order the properties were requested
+    for prop_name, match in zip(properties, matches):
+        if not match:
+            errors.append({
+                "property": prop_name,
+                "error": "Property not found",
+            })
+            continue
+
+        result = next(reports)
+        if isinstance(result, GAClientError):
+            errors.append({
+                "property": match.property.display_name,
+                "error": str(result),
+            })
+            continue
+        if isinstance(result, BaseException):
+            raise result
+
+        # Calculate totals from first row (summary)
+        if result["rows"] and not dimensions:
+            row0 = result["rows"][0]
+            for metric in metrics:
+                val = row0.get(metric)
+                if type(val) in _NUMERIC_TYPES:
+                    totals[metric] += val
+
+        results.append({
+            "property_id": match.property.id,
+            "property_name": match.property.display_name,
+            "data": result["rows"],
+            "row_count": result["row_count"],
+        })
+
+    return {
+        "date_range": {
+            "start_date": start,
+            "end_date": end,
+            "description": get_date_range_description(start, end),
+        },
+        "metrics": metrics,
+        "dimensions": dimensions or [],
+        "results": results,
+        "errors": errors if errors else None,
+        "summary": {
+            "properties_queried": len(properties),
+            "properties_successful": len(results),
+            "totals": totals if not dimensions else None,
+        },
+    }
 
 
 @mcp.tool(annotations={"readOnlyHint": True})
@@ -316,23 +377,81 @@ async def get_property_metadata(
         client = get_ga_client()
         metadata = await client.get_metadata(match.property.id)
 
-        return {
-            "property_id": match.property.id,
-            "property_name": match.property.display_name,
-            "dimensions": metadata.dimensions,
-            "metrics": metadata.metrics,
-            "custom_dimensions": metadata.custom_dimensions,
-            "custom_metrics": metadata.custom_metrics,
-            "total_dimensions": len(metadata.dimensions) + len(metadata.custom_dimensions),
-            "total_metrics": len(metadata.metrics) + len(metadata.custom_metrics),
-        }
+        return _metadata_result(match.property, metadata)
 
-    except ConfigError as e:
-        raise ToolError(f"Configuration error: {e}")
     except GAClientError as e:
         raise ToolError(f"Failed to get metadata: {e}")
 
 
+@mcp.tool(annotations={"readOnlyHint": True})
+async def get_properties_metadata(
+    properties: Annotated[List[str], Field(description="List of property names or IDs")]
+) -> Dict[str, Any]:
+    """
+    Get available dimensions and metrics for several GA4 properties at once.
+
+    Faster than calling get_property_metadata repeatedly: metadata for
+    all properties is fetched concurrently.
+
+    Args:
+        properties: List of property identifiers
+
+    Returns:
+        Dict with per-property metadata results and any errors
+    """
+    resolver = get_property_resolver()
+    client = get_ga_client()
+
+    results = []
+    errors = []
+
+    # Resolve all properties, then fetch their metadata concurrently
+    matches = await asyncio.gather(*(resolver.resolve(p) for p in properties))
+
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_METADATA)
+
+    async def fetch_metadata(property_id: str) -> GAMetadata:
+        async with semaphore:
+            return await client.get_metadata(property_id)
+
+    metadata_results = iter(
+        await asyncio.gather(
+            *(fetch_metadata(m.property.id) for m in matches if m),
+            return_exceptions=True,
+        )
+    )
+
+    # Collect results in the order the properties were requested
+    for prop_name, match in zip(properties, matches):
+        if not match:
+            errors.append({
+                "property": prop_name,
+                "error": "Property not found",
+            })
+            continue
+
+        metadata = next(metadata_results)
+        if isinstance(metadata, GAClientError):
+            errors.append({
+                "property": match.property.display_name,
+                "error": str(metadata),
+            })
+            continue
+        if isinstance(metadata, BaseException):
+            raise metadata
+
+        results.append(_metadata_result(match.property, metadata))
+
+    return {
+        "results": results,
+        "errors": errors if errors else None,
+        "summary": {
+            "properties_queried": len(properties),
+            "properties_successful": len(results),
+        },
+    }
+
+
 @mcp.tool(annotations={"readOnlyHint": True})
 async def query_realtime(
     property: Annotated[str, Field(description="Property name or ID")],
@@ -374,8 +493,6 @@ async def query_realtime(
 
         return result
 
-    except ConfigError as e:
-        raise ToolError(f"Configuration error: {e}")
     except GAClientError as e:
         raise ToolError(f"Realtime query failed: {e}")
 
@@ -391,16 +508,13 @@ async def get_cache_status() -> Dict[str, Any]:
     Returns:
         Dict with cache statistics
     """
-    try:
-        client = get_ga_client()
-        return client.get_cache_stats()
-    except ConfigError as e:
-        raise ToolError(f"Configuration error: {e}")
+    client = get_ga_client()
+    return client.get_cache_stats()
 
 
 @mcp.tool
 async def clear_cache(
-    pattern: Annotated[Optional[str], Field(description="Optional pattern to match (e.g., 'metadata:', 'properties')")] = None
+    pattern: Annotated[Optional[str], Field(description="Optional substring or glob pattern to match (e.g., 'metadata:', 'report:', 'report:123:*')")] = None
 ) -> Dict[str, Any]:
     """
     Clear cached data.
@@ -409,29 +523,26 @@ async def clear_cache(
     Can clear all cache or just entries matching a pattern.
 
     Args:
-        pattern: Optional pattern to match cache keys
+        pattern: Optional substring or glob pattern to match cache keys
 
     Returns:
         Dict with number of entries cleared
     """
-    try:
-        client = get_ga_client()
-        resolver = get_property_resolver()
+    client = get_ga_client()
+    resolver = get_property_resolver()
 
-        # Clear GA client cache
-        cleared = client.clear_cache(pattern)
+    # Clear GA client cache
+    cleared = client.clear_cache(pattern)
 
-        # Also clear property resolver cache if clearing all
-        if pattern is None:
-            resolver.clear_cache()
+    # Also clear property resolver cache if clearing all
+    if pattern is None:
+        resolver.clear_cache()
 
-        return {
-            "cleared_entries": cleared,
-            "pattern": pattern,
-            "message": f"Cleared {cleared} cache entries" + (f" matching '{pattern}'" if pattern else ""),
-        }
-    except ConfigError as e:
-        raise ToolError(f"Configuration error: {e}")
+    return {
+        "cleared_entries": cleared,
+        "pattern": pattern,
+        "message": f"Cleared {cleared} cache entries" + (f" matching '{pattern}'" if pattern else ""),
+    }
 
 
 def main():
@@ -448,6 +559,13 @@ def main():
     )
     parser.parse_args()
 
+    # Fail fast on missing or invalid configuration; tools assume it is valid
+    try:
+        get_config()
+    except ConfigError as e:
+        logger.error(f"Configuration error: {e}")
+        sys.exit(1)
+
     mcp.run()
 
 
@@ -0,0 +1,87 @@
+"""Tests for date parsing."""
+
+from datetime import datetime
+
+import pytest
+
+from ga_multi_mcp.date_parser import (
+    DateParseError,
+    get_date_range_description,
+    parse_date,
+    parse_date_range,
+)
+
+# A Friday
+TODAY = datetime(2024, 3, 15)
+
+
+@pytest.mark.parametrize(
+    "date_str, expected",
+    [
+        # ISO fast path and ISO with surrounding whitespace
+        ("2024-01-15", "2024-01-15"),
+        (" 2024-01-15 ", "2024-01-15"),
+        # US format, 1-2 digit month and day
+        ("01/15/2024", "2024-01-15"),
+        ("1/5/2024", "2024-01-05"),
+        # Keywords, with case and whitespace variants
+        ("today", "2024-03-15"),
+        ("  Yesterday ", "2024-03-14"),
+        ("LAST WEEK", "2024-03-04"),
+        ("lastmonth", "2024-02-01"),
+        ("this week", "2024-03-11"),
+        ("thismonth", "2024-03-01"),
+        ("YTD", "2024-01-01"),
+        ("last year", "2023-01-01"),
+        # N units ago, with optional spaces and plural
+        ("7 days ago", "2024-03-08"),
+        ("7daysago", "2024-03-08"),
+        ("7daysAgo", "2024-03-08"),
+        ("1 week ago", "2024-03-08"),
+        ("2weeksAgo", "2024-03-01"),
+        ("3monthsago", "2023-12-16"),
+    ],
+)
+def test_parse_date(date_str, expected):
+    assert parse_date(date_str, today=TODAY) == expected
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    ["", "soon", "02/30/2024", "13/01/2024", "2024/01/15", "x days ago", "7 fortnights ago"],
+)
+def test_parse_date_invalid(date_str):
+    with pytest.raises(DateParseError):
+        parse_date(date_str, today=TODAY)
+
+
+def test_parse_date_range():
+    assert parse_date_range("7daysAgo", "today", today=TODAY) == ("2024-03-08", "2024-03-15")
+    assert parse_date_range("2024-01-01", "2024-01-31", today=TODAY) == (
+        "2024-01-01",
+        "2024-01-31",
+    )
+
+
+def test_parse_date_range_rejects_reversed_range():
+    with pytest.raises(DateParseError):
+        parse_date_range("today", "yesterday", today=TODAY)
+
+
+@pytest.mark.parametrize(
+    "start_date, end_date, expected",
+    [
+        ("2024-03-15", "2024-03-15", "Today"),
+        ("2024-03-14", "2024-03-14", "Yesterday"),
+        ("2024-03-01", "2024-03-01", "March 01, 2024"),
+        ("2024-03-09", "2024-03-15", "Last 7 days"),
+        ("2024-02-15", "2024-03-15", "Last 30 days"),
+        ("2023-12-17", "2024-03-15", "Last 90 days"),
+        # Ranges not ending today, or of other lengths, are spelled out
+        ("2024-03-08", "2024-03-15", "Mar 08 - Mar 15, 2024 (8 days)"),
+        ("2024-03-09", "2024-03-14", "Mar 09 - Mar 14, 2024 (6 days)"),
+        ("2024-01-01", "2024-01-31", "Jan 01 - Jan 31, 2024 (31 days)"),
+    ],
+)
+def test_get_date_range_description(start_date, end_date, expected):
+    assert get_date_range_description(start_date, end_date, today=TODAY) == expected
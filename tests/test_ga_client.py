@@ -0,0 +1,194 @@
+"""Tests for GAClient report caching and request coalescing."""
+
+import asyncio
+import threading
+import time
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from google.analytics.data_v1beta.types import (
+    DimensionHeader,
+    DimensionMetadata,
+    DimensionValue,
+    Metadata,
+    MetricHeader,
+    MetricMetadata,
+    MetricType,
+    MetricValue,
+    Row,
+    RunReportResponse,
+)
+
+from ga_multi_mcp import ga_client
+from ga_multi_mcp.ga_client import GAClient
+
+
+class StubDataClient:
+    """Data API stub serving `rows` rows of date/sessions and fixed metadata."""
+
+    def __init__(self, rows=3):
+        self.rows = rows
+        self.report_calls = 0
+        self.metadata_calls = 0
+        self._lock = threading.Lock()
+
+    def run_report(self, request=None):
+        with self._lock:
+            self.report_calls += 1
+        rows = [
+            Row(
+                dimension_values=[DimensionValue(value=f"2024010{i}")],
+                metric_values=[MetricValue(value=str(i))],
+            )
+            for i in range(self.rows)
+        ][request.offset:request.offset + request.limit]
+        return RunReportResponse(
+            dimension_headers=[DimensionHeader(name="date")],
+            metric_headers=[
+                MetricHeader(name="sessions", type_=MetricType.TYPE_INTEGER)
+            ],
+            rows=rows,
+            row_count=self.rows,
+        )
+
+    def get_metadata(self, name=None):
+        with self._lock:
+            self.metadata_calls += 1
+        # Keep the request open long enough for concurrent callers to join it
+        time.sleep(0.05)
+        return Metadata(
+            name=name,
+            dimensions=[DimensionMetadata(api_name="date", ui_name="Date")],
+            metrics=[MetricMetadata(api_name="sessions", ui_name="Sessions")],
+        )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """GAClient with a stub Data API client and no credentials."""
+    monkeypatch.setattr(
+        ga_client,
+        "get_config",
+        lambda: SimpleNamespace(
+            credentials_path="unused.json",
+            cache_ttl=300,
+            property_cache_ttl=3600,
+            metadata_cache_ttl=3600,
+            cache_max_entries=1024,
+        ),
+    )
+    client = GAClient()
+    client._initialized = True
+    client._data_client = StubDataClient()
+    return client
+
+
+async def _report(client, property_id="123", end_date="2024-01-31", **kwargs):
+    return await client.run_report(
+        property_id,
+        ["sessions"],
+        "2024-01-01",
+        end_date,
+        dimensions=["date"],
+        **kwargs,
+    )
+
+
+def _report_keys(client):
+    return [key for key in client._cache if key.startswith("report:")]
+
+
+async def test_identical_report_served_from_cache(client):
+    first = await _report(client)
+    second = await _report(client)
+
+    assert second == first
+    assert first["rows"] == [
+        {"date": "20240100", "sessions": 0},
+        {"date": "20240101", "sessions": 1},
+        {"date": "20240102", "sessions": 2},
+    ]
+    assert client._data_client.report_calls == 1
+
+    await _report(client, limit=2)
+    assert client._data_client.report_calls == 2
+
+
+async def test_cached_report_is_copied(client):
+    first = await _report(client)
+    first["property_name"] = "Annotated"
+
+    assert "property_name" not in await _report(client)
+
+
+async def test_report_including_today_uses_short_ttl(client):
+    await _report(client, property_id="1")
+    await _report(client, property_id="2", end_date=date.today().isoformat())
+    await _report(client, property_id="3", end_date="today")
+
+    now = time.monotonic()
+    ttls = {
+        key.split(":")[1]: entry.expires_at - now
+        for key, entry in client._cache.items()
+    }
+    assert 290 < ttls["1"] <= 300
+    assert 0 < ttls["2"] <= ga_client._LIVE_REPORT_CACHE_TTL
+    assert 0 < ttls["3"] <= ga_client._LIVE_REPORT_CACHE_TTL
+
+
+async def test_large_report_not_cached(client, monkeypatch):
+    monkeypatch.setattr(ga_client, "_MAX_CACHED_REPORT_ROWS", 2)
+
+    result = await _report(client)
+    await _report(client)
+
+    assert result["row_count"] == 3
+    assert _report_keys(client) == []
+    assert client._data_client.report_calls == 2
+
+
+async def test_invalidate_and_clear_cache(client):
+    for property_id in ("123", "1234", "456"):
+        await _report(client, property_id=property_id)
+    client._set_cached("metadata:123", object(), category="metadata")
+
+    assert client.invalidate("123") == 2
+    assert sorted(k.split(":")[1] for k in client._cache) == ["1234", "456"]
+
+    await _report(client, property_id="123")
+    assert client.clear_cache("report:123:*") == 1
+    assert sorted(k.split(":")[1] for k in client._cache) == ["1234", "456"]
+
+
+async def test_lru_eviction(client):
+    client.cache_max_entries = 2
+    await _report(client, property_id="1")
+    await _report(client, property_id="2")
+    # Touch "1" so "2" becomes the least recently used
+    await _report(client, property_id="1")
+    await _report(client, property_id="3")
+
+    assert [k.split(":")[1] for k in client._cache] == ["1", "3"]
+    assert client._data_client.report_calls == 3
+
+
+def test_expired_entries_swept_on_interval(client):
+    client._set_cached("stale", 1)
+    client._cache["stale"].expires_at = time.monotonic() - 1
+
+    # Within the sweep interval the expired entry is left alone
+    client._set_cached("fresh", 2)
+    assert "stale" in client._cache
+
+    client._last_sweep -= ga_client._CACHE_SWEEP_INTERVAL
+    client._set_cached("fresher", 3)
+    assert list(client._cache) == ["fresh", "fresher"]
+
+
+async def test_concurrent_metadata_requests_coalesced(client):
+    results = await asyncio.gather(*(client.get_metadata("123") for _ in range(3)))
+
+    assert client._data_client.metadata_calls == 1
+    assert all(result is results[0] for result in results)
+    assert client._in_flight == {}
@@ -0,0 +1,105 @@
+"""Tests for property name resolution."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from ga_multi_mcp import property_resolver
+from ga_multi_mcp.ga_client import GAProperty
+from ga_multi_mcp.property_resolver import PropertyResolver
+
+PROPERTIES = [
+    GAProperty(id="101", name="", display_name="Store Site", account_id="1"),
+    GAProperty(id="102", name="", display_name="Web Shop", account_id="1"),
+    GAProperty(id="103", name="", display_name="Test Property", account_id="2"),
+    GAProperty(id="104", name="", display_name="Staging Site", account_id="2"),
+]
+
+
+class FakeClient:
+    """GA client stub that only serves a fixed property list."""
+
+    def __init__(self, properties=PROPERTIES):
+        self.properties = properties
+
+    async def discover_properties(self):
+        return self.properties
+
+
+@pytest.fixture(params=["rapidfuzz", "difflib"])
+def resolver(request, monkeypatch):
+    """Resolver over PROPERTIES, with and without the RapidFuzz prefilter."""
+    if request.param == "rapidfuzz":
+        pytest.importorskip("rapidfuzz")
+    else:
+        monkeypatch.setattr(property_resolver, "_rapidfuzz_extract", None)
+    monkeypatch.setattr(
+        property_resolver,
+        "get_config",
+        lambda: SimpleNamespace(fuzzy_threshold=0.6, custom_aliases={}),
+    )
+    return PropertyResolver(client=FakeClient())
+
+
+def _summary(match):
+    return (match.property.id, round(match.confidence, 3), match.matched_on)
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("Store Site", ("101", 1.0, "exact_name")),
+        ("storsite", ("101", 0.941, "fuzzy_name")),
+        ("xtoresite", ("101", 0.889, "fuzzy_name")),
+        ("web shp", ("102", 0.923, "fuzzy_name")),
+        ("test", ("103", 0.8, "partial")),
+        ("site", ("101", 0.833, "partial")),
+        ("tst", None),
+        ("zzz", None),
+    ],
+)
+async def test_resolve(resolver, query, expected):
+    match = await resolver.resolve(query)
+    assert (match and _summary(match)) == expected
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("tst", [("103", 0.4, "fuzzy"), ("101", 0.333, "fuzzy")]),
+        (
+            "storsite",
+            [("101", 0.941, "fuzzy"), ("104", 0.632, "fuzzy"), ("103", 0.5, "fuzzy")],
+        ),
+        (
+            "test",
+            [("103", 0.8, "fuzzy"), ("102", 0.364, "fuzzy"), ("101", 0.308, "fuzzy")],
+        ),
+        ("zzz", []),
+    ],
+)
+async def test_search(resolver, query, expected):
+    assert [_summary(m) for m in await resolver.search(query)] == expected
+
+
+async def test_resolve_with_suggestions_matches_resolve_and_search(resolver):
+    for query in ("tst", "storsite", "zzz"):
+        result = await resolver.resolve_with_suggestions(query)
+        match = await resolver.resolve(query)
+        assert result.match == match
+        if match is None:
+            expected = await resolver.search(query, max_results=3)
+            assert [_summary(m) for m in result.suggestions] == [
+                _summary(m) for m in expected
+            ]
+
+
+async def test_resolve_prefers_better_match_outside_first_letter(resolver):
+    # "x" shares no first letter with either property; the shorter name is
+    # the better match even though "Web Store Site" starts next to "x"
+    resolver.client = FakeClient([
+        GAProperty(id="201", name="", display_name="Store Site", account_id="1"),
+        GAProperty(id="202", name="", display_name="Web Store Site", account_id="1"),
+    ])
+    match = await resolver.resolve("xtoresite")
+    assert _summary(match) == ("201", 0.889, "fuzzy_name")